@@ -0,0 +1,32 @@
+"""Optional Numba support.
+
+Exposes ``njit`` from Numba when it is installed; otherwise a no-op
+decorator so every kernel still runs as plain Python/NumPy code.
+"""
+
+
+def as_writable(arr):
+    """Return ``arr``, copying it only when it is read-only.
+
+    The kernels carry explicit writable-array signatures, but pandas
+    copy-on-write hands out read-only views from ``to_numpy()`` when no
+    dtype conversion is needed (e.g. Close already float64). Route
+    kernel inputs through this so such frames don't hit
+    ``No matching definition``; the common float32 pipeline converts and
+    therefore never copies here.
+    """
+    return arr if arr.flags.writeable else arr.copy()
+
+
+try:
+    from numba import njit  # noqa: F401
+except ImportError:  # pragma: no cover - exercised only without numba
+    def njit(*args, **kwargs):
+        """Fallback decorator that returns the function unchanged."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrapper(func):
+            return func
+
+        return wrapper
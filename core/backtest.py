@@ -20,34 +20,87 @@ def backtest_signals(df: pd.DataFrame, initial_capital: float = 1_000.0) -> pd.S
     -------
     equity : pd.Series aligned with df.index.
     """
-    df = df.sort_index().copy()
+    if len(df) == 0:
+        return pd.Series(np.empty(0), index=df.index, name="Equity")
+
+    # Extract only the needed columns as arrays instead of copying the
+    # whole (potentially indicator-heavy) frame just to sort it. Skip the
+    # argsort entirely when the index is already monotonic (common case).
+    if df.index.is_monotonic_increasing:
+        order = None
+        idx = df.index
+    else:
+        order = np.argsort(df.index.to_numpy(), kind="mergesort")
+        idx = df.index[order]
+
+    def _col(name: str, dtype, optional: bool = False) -> np.ndarray:
+        # Only the scale-in columns may legitimately be absent; a frame
+        # without Close/signal should raise like the baseline did
+        if optional and name not in df.columns:
+            return np.zeros(len(df), dtype=dtype)
+        arr = df[name].to_numpy(dtype=dtype)
+        return arr if order is None else arr[order]
+
+    close = _col("Close", np.float64)
 
     # Price returns
-    pct_ret = df["Close"].pct_change().fillna(0.0)
-
-    # Build dynamic position including entry and double-down scaling
-    entry = df.get("entry_signal", pd.Series(0, index=df.index))
-    dd    = df.get("double_down",    pd.Series(0, index=df.index))
-
-    position = []
-    prev_pos = 0
-    for sig, ent, ddown in zip(df["signal"], entry, dd):
-        if sig == 0:
-            pos = 0
-        elif ent != 0:
-            pos = ent
-        elif ddown != 0:
-            pos = ddown
-        else:
-            pos = prev_pos
-        position.append(pos)
-        prev_pos = pos
-    position = pd.Series(position, index=df.index)
-  
-    # Strategy return per bar
-    strat_ret = pct_ret * position.shift(1).fillna(0)
+    pct_ret = np.empty_like(close)
+    pct_ret[0] = 0.0
+    pct_ret[1:] = close[1:] / close[:-1] - 1.0
+
+    # Build dynamic position including entry and double-down scaling.
+    # Vectorized state machine: each bar holds the most recent non-zero
+    # entry/double-down size, zeroed wherever the signal itself is 0.
+    signal = _col("signal", np.int8)
+    entry = _col("entry_signal", np.int8, optional=True)
+    dd    = _col("double_down", np.int8, optional=True)
+
+    pos = np.where(entry != 0, entry, np.where(dd != 0, dd, 0)).astype(np.int8)
+    # Forward-fill non-zero sizes by gathering the last index that set one
+    gather = np.maximum.accumulate(np.where(pos != 0, np.arange(len(pos)), 0))
+    pos = pos[gather]
+    pos = np.where(signal != 0, pos, 0)
+
+    # Strategy return per bar (position held from the previous bar)
+    prev_pos = np.empty_like(pos)
+    prev_pos[0] = 0
+    prev_pos[1:] = pos[:-1]
+    strat_ret = pct_ret * prev_pos
 
     # Equity curve
-    equity = (1 + strat_ret).cumprod() * initial_capital
-    equity.name = "Equity"
-    return equity
\ No newline at end of file
+    equity = pd.Series(
+        np.cumprod(1 + strat_ret) * initial_capital,
+        index=idx,
+        name="Equity",
+    )
+    return equity
+
+def backtest_signals_batch(
+    dfs: list, initial_capital: float = 1_000.0, n_jobs: int = -1
+) -> list:
+    """
+    Run backtest_signals over many independent frames in parallel.
+
+    The natural unit of parallelism for multi-asset or parameter-sweep
+    studies is one frame per backtest, so dispatch them across CPU
+    cores with joblib. Falls back to a serial loop when joblib is not
+    installed.
+
+    Args
+    ----
+    dfs : list of DataFrames, each with 'Close' and 'signal'.
+    initial_capital : starting account value per backtest.
+    n_jobs : worker count (joblib convention; -1 = all cores).
+
+    Returns
+    -------
+    list of equity curves, in the same order as dfs.
+    """
+    try:
+        from joblib import Parallel, delayed
+    except ImportError:
+        return [backtest_signals(df, initial_capital) for df in dfs]
+
+    return Parallel(n_jobs=n_jobs, backend="loky", batch_size="auto")(
+        delayed(backtest_signals)(df, initial_capital) for df in dfs
+    )
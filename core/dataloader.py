@@ -1,15 +1,34 @@
+import numpy as np
 import pandas as pd
 from typing import Dict, Any
 from loguru import logger
 
-def load_data(path: str) -> pd.DataFrame:
+def _downcast(df: pd.DataFrame, dtype) -> pd.DataFrame:
+    """Downcast price/volume columns to the requested float dtype."""
+    for col in ('Open', 'High', 'Low', 'Close', 'Volume'):
+        if col in df.columns:
+            df[col] = df[col].astype(dtype)
+    return df
+
+def load_data(path: str, dtype=np.float32) -> pd.DataFrame:
     """
     Load CSV data from the given path, parse dates, and set the first column as the index.
     Expects CSV with a datetime index column (e.g., 'Date') and columns: Open, High, Low, Close, Volume.
+
+    Price and volume columns are downcast to `dtype` (float32 by
+    default) — half the memory bandwidth for every downstream rolling
+    pass, at precision far beyond what minute OHLCV needs. Pass
+    dtype=np.float64 to keep full precision.
     """
-    logger.debug(f"Loading data from {path}")
-    # Read CSV; expect columns 'date', 'price', 'volume', or standard OHLCV
-    df = pd.read_csv(path, parse_dates=['date'])
+    logger.debug("Loading data from {}", path)
+    # Read CSV; expect columns 'date', 'price', 'volume', or standard OHLCV.
+    # The pyarrow engine reads in parallel and parses timestamps in C++;
+    # fall back to the default C engine when pyarrow is not installed.
+    try:
+        df = pd.read_csv(path, engine='pyarrow')
+        df['date'] = pd.to_datetime(df['date'], format='ISO8601', cache=True)
+    except ImportError:
+        df = pd.read_csv(path, parse_dates=['date'])
     df = df.rename(columns={'date': 'Date', 'price': 'Close', 'volume': 'Volume'})
     df.set_index('Date', inplace=True)
 
@@ -18,7 +37,24 @@ def load_data(path: str) -> pd.DataFrame:
         if col not in df.columns:
             df[col] = df['Close']
 
-    return df
+    return _downcast(df, dtype)
+
+def load_parquet(path: str, dtype=np.float32) -> pd.DataFrame:
+    """
+    Load a Parquet file with the same column conventions as load_data.
+    Columnar and typed, so typically much faster than re-parsing CSV.
+    """
+    logger.debug("Loading parquet data from {}", path)
+    df = pd.read_parquet(path)
+    if 'date' in df.columns:
+        df = df.rename(columns={'date': 'Date', 'price': 'Close', 'volume': 'Volume'})
+        df.set_index('Date', inplace=True)
+
+    for col in ('Open', 'High', 'Low'):
+        if col not in df.columns:
+            df[col] = df['Close']
+
+    return _downcast(df, dtype)
 
 def resample_df(df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
     """
@@ -32,6 +68,42 @@ def resample_df(df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
     elif timeframe_norm.endswith(("T", "t")):
         timeframe_norm = timeframe_norm[:-1] + "min"  # e.g., '15T' → '15min'
 
+    logger.debug("Resampling to {}", timeframe)
+    # Skip the O(N log N) sort when the index is already monotonic
+    # (the common case for OHLCV data; the check is cached on the index)
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+
+    try:
+        period_ns = pd.Timedelta(timeframe_norm).value
+    except ValueError:
+        period_ns = 0  # calendar-based frequency, e.g. months
+    # The bucketing below anchors to the Unix epoch, which only matches
+    # pandas' bin edges for periods that evenly divide a day — weeks are
+    # W-SUN anchored and multi-day periods use origin='start_day', so
+    # those (and calendar frequencies) take the resample() path instead.
+    day_ns = 86_400_000_000_000
+    if period_ns > 0 and day_ns % period_ns == 0:
+        # Fixed-period resample as a direct integer-bucketing pass:
+        # bucket each timestamp, find bucket boundaries, then aggregate
+        # every column with one reduceat/gather instead of building a
+        # full GroupBy per column. Empty buckets simply never appear.
+        bucket = df.index.as_unit('ns').view('int64') // period_ns
+        ubucket, starts, counts = np.unique(
+            bucket, return_index=True, return_counts=True
+        )
+        ends = starts + counts - 1
+        return pd.DataFrame(
+            {
+                'Open': df['Open'].to_numpy()[starts],
+                'High': np.maximum.reduceat(df['High'].to_numpy(), starts),
+                'Low': np.minimum.reduceat(df['Low'].to_numpy(), starts),
+                'Close': df['Close'].to_numpy()[ends],
+                'Volume': np.add.reduceat(df['Volume'].to_numpy(), starts),
+            },
+            index=pd.DatetimeIndex(ubucket * period_ns, name=df.index.name),
+        )
+
     ohlc: Dict[str, Any] = {
         'Open': 'first',
         'High': 'max',
@@ -39,7 +111,5 @@ def resample_df(df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
         'Close': 'last',
         'Volume': 'sum'
     }
-    logger.debug(f"Resampling to {timeframe}")
-    df = df.sort_index()
     df_resampled = df.resample(timeframe_norm).agg(ohlc).dropna()  # type: ignore[arg-type]
     return df_resampled
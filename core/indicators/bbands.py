@@ -1,10 +1,54 @@
+import numpy as np
 import pandas as pd
 
+from core._njit import as_writable, njit
+
+
+@njit("UniTuple(f8[::1], 3)(f8[::1], i8, f8)", cache=True)
+def _bbands(close, window, n_sigma):
+    """Single-pass rolling mean/std via a sliding Welford update.
+
+    Welford's add/remove recurrences keep the mean and the centred
+    M2 sum directly, avoiding the catastrophic cancellation that the
+    naive sum-of-squares variance suffers on near-constant segments.
+    """
+    n = len(close)
+    mid = np.full(n, np.nan)
+    upper = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    mean = 0.0
+    m2 = 0.0
+    count = 0
+    for i in range(n):
+        x = close[i]
+        count += 1
+        d = x - mean
+        mean += d / count
+        m2 += d * (x - mean)
+        if i >= window:
+            y = close[i - window]
+            dy = y - mean
+            mean -= dy / (count - 1)
+            m2 -= dy * (y - mean)
+            count -= 1
+        if i >= window - 1:
+            # sample variance (ddof=1) to match pandas rolling std
+            var = m2 / (window - 1)
+            if var < 0.0:
+                var = 0.0
+            band = n_sigma * np.sqrt(var)
+            mid[i] = mean
+            upper[i] = mean + band
+            lower[i] = mean - band
+    return mid, upper, lower
+
+
 def bollinger(df: pd.DataFrame, window: int = 20, n_sigma: float = 2.0) -> pd.DataFrame:
-    sma = df["Close"].rolling(window).mean()
-    std = df["Close"].rolling(window).std()
+    mid, upper, lower = _bbands(
+        as_writable(df["Close"].to_numpy(dtype=np.float64)), window, float(n_sigma)
+    )
 
-    df[f"BB_M_{window}"] = sma
-    df[f"BB_U_{window}"] = sma + n_sigma * std
-    df[f"BB_L_{window}"] = sma - n_sigma * std
-    return df
\ No newline at end of file
+    df[f"BB_M_{window}"] = mid
+    df[f"BB_U_{window}"] = upper
+    df[f"BB_L_{window}"] = lower
+    return df
@@ -1,5 +1,38 @@
+import numpy as np
 import pandas as pd
 
+from core._njit import as_writable, njit
+
+
+@njit("UniTuple(f8[::1], 3)(f8[::1], i8, i8, i8)", cache=True)
+def _macd(close, fast, slow, signal):
+    """Fused MACD: fast/slow/signal EMAs as scalar recurrences, one pass."""
+    n = len(close)
+    macd_line = np.empty(n)
+    signal_line = np.empty(n)
+    hist = np.empty(n)
+    if n == 0:
+        return macd_line, signal_line, hist
+    alpha_fast = 2.0 / (fast + 1.0)
+    alpha_slow = 2.0 / (slow + 1.0)
+    alpha_sig = 2.0 / (signal + 1.0)
+    f = close[0]
+    s = close[0]
+    g = 0.0
+    for i in range(n):
+        x = close[i]
+        f += alpha_fast * (x - f)
+        s += alpha_slow * (x - s)
+        m = f - s
+        if i == 0:
+            g = m
+        else:
+            g += alpha_sig * (m - g)
+        macd_line[i] = m
+        signal_line[i] = g
+        hist[i] = m - g
+    return macd_line, signal_line, hist
+
 
 def macd(
     df: pd.DataFrame,
@@ -11,13 +44,11 @@ def macd(
 
     Adds columns 'MACD', 'MACD_signal', and 'MACD_hist'.
     """
-    fast_ema = df["Close"].ewm(span=fast, adjust=False).mean()
-    slow_ema = df["Close"].ewm(span=slow, adjust=False).mean()
-    macd_line = fast_ema - slow_ema
-    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+    macd_line, signal_line, hist = _macd(
+        as_writable(df["Close"].to_numpy(dtype=np.float64)), fast, slow, signal
+    )
 
     df["MACD"] = macd_line
     df["MACD_signal"] = signal_line
-    df["MACD_hist"] = macd_line - signal_line
+    df["MACD_hist"] = hist
     return df
-
@@ -1,5 +1,25 @@
+import numpy as np
 import pandas as pd
 
+from core._njit import as_writable, njit
+
+
+@njit("f8[::1](f8[::1], i8)", cache=True)
+def _sma(close, window):
+    """Running-sum SMA with partial windows (min_periods=1 semantics)."""
+    n = len(close)
+    out = np.empty(n)
+    s = 0.0
+    for i in range(n):
+        s += close[i]
+        if i >= window:
+            s -= close[i - window]
+            out[i] = s / window
+        else:
+            out[i] = s / (i + 1)
+    return out
+
+
 def sma(df: pd.DataFrame, window: int = 20) -> pd.DataFrame:
     """
     Simple Moving Average (SMA)
@@ -7,7 +27,7 @@ def sma(df: pd.DataFrame, window: int = 20) -> pd.DataFrame:
     Adds a column 'SMA_{window}' to the DataFrame.
     """
     col_name = f"SMA_{window}"
-    df[col_name] = df["Close"].rolling(window=window, min_periods=1).mean()
+    df[col_name] = _sma(as_writable(df["Close"].to_numpy(dtype=np.float64)), window)
     return df
 
 def ema(df: pd.DataFrame, window: int = 20) -> pd.DataFrame:
@@ -1,20 +1,42 @@
+import numpy as np
 import pandas as pd
 
+from core._njit import as_writable, njit
+
+
+@njit("f8[::1](f8[::1], i8)", cache=True)
+def _rsi(close, window):
+    """Single-pass RSI: delta, gain/loss and EMA smoothing in one loop."""
+    n = len(close)
+    out = np.full(n, np.nan)
+    if n < 2:
+        return out
+    alpha = 2.0 / (window + 1.0)
+    # Seed the averages from the first delta (matches ewm(adjust=False)
+    # skipping the leading NaN from diff())
+    delta = close[1] - close[0]
+    avg_gain = delta if delta > 0 else 0.0
+    avg_loss = -delta if delta < 0 else 0.0
+    for i in range(1, n):
+        if i > 1:
+            delta = close[i] - close[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            avg_gain = alpha * gain + (1.0 - alpha) * avg_gain
+            avg_loss = alpha * loss + (1.0 - alpha) * avg_loss
+        if avg_loss > 0.0:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0.0:
+            out[i] = 100.0
+    return out
+
+
 def rsi(df: pd.DataFrame, window: int = 14) -> pd.DataFrame:
     """
     Relative Strength Index (RSI)
 
     Adds a column 'RSI_{window}' to the DataFrame.
     """
-    delta = df["Close"].diff()
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
-
-    # Use exponential moving average for smoothing
-    avg_gain = gain.ewm(span=window, adjust=False).mean()
-    avg_loss = loss.ewm(span=window, adjust=False).mean()
-
-    rs = avg_gain / avg_loss
     col_name = f"RSI_{window}"
-    df[col_name] = 100 - (100 / (1 + rs))
+    df[col_name] = _rsi(as_writable(df["Close"].to_numpy(dtype=np.float64)), window)
     return df
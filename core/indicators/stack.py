@@ -0,0 +1,128 @@
+"""Batched indicator computation.
+
+Attaching indicators one column at a time grows the DataFrame's
+BlockManager repeatedly; each insert can trigger a consolidation copy.
+``compute_indicators`` fills one preallocated float64 buffer from the
+indicator kernels and attaches every column in a single assignment.
+"""
+
+import numpy as np
+import pandas as pd
+
+from core._njit import as_writable, njit
+from core.indicators.bbands import _bbands
+from core.indicators.moving_averages import _sma
+from core.indicators.rsi import _rsi
+
+
+@njit("UniTuple(f8[::1], 4)(f8[::1], i8, i8, f8)", cache=True)
+def _rsi_bbands(close, rsi_window, bb_window, n_sigma):
+    """Fused RSI + Bollinger pass: one loop over Close, O(1) state.
+
+    Combines the Wilder recurrence from core.indicators.rsi._rsi with
+    the sliding Welford mean/std from core.indicators.bbands._bbands so
+    the zone features touch the price array once instead of twice.
+    """
+    n = len(close)
+    rsi = np.full(n, np.nan)
+    mid = np.full(n, np.nan)
+    upper = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+
+    alpha = 2.0 / (rsi_window + 1.0)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    mean = 0.0
+    m2 = 0.0
+    count = 0
+    for i in range(n):
+        x = close[i]
+
+        # --- Wilder-smoothed RSI ---
+        if i >= 1:
+            delta = x - close[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            if i == 1:
+                avg_gain = gain
+                avg_loss = loss
+            else:
+                avg_gain = alpha * gain + (1.0 - alpha) * avg_gain
+                avg_loss = alpha * loss + (1.0 - alpha) * avg_loss
+            if avg_loss > 0.0:
+                rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            elif avg_gain > 0.0:
+                rsi[i] = 100.0
+
+        # --- Bollinger via sliding Welford ---
+        count += 1
+        d = x - mean
+        mean += d / count
+        m2 += d * (x - mean)
+        if i >= bb_window:
+            y = close[i - bb_window]
+            dy = y - mean
+            mean -= dy / (count - 1)
+            m2 -= dy * (y - mean)
+            count -= 1
+        if i >= bb_window - 1:
+            var = m2 / (bb_window - 1)
+            if var < 0.0:
+                var = 0.0
+            band = n_sigma * np.sqrt(var)
+            mid[i] = mean
+            upper[i] = mean + band
+            lower[i] = mean - band
+
+    return rsi, mid, upper, lower
+
+
+def compute_indicators(
+    df: pd.DataFrame,
+    sma_window: int | None = None,
+    rsi_window: int | None = None,
+    bb_window: int | None = None,
+    bb_sigma: float = 2.0,
+) -> pd.DataFrame:
+    """
+    Compute the requested indicators on df['Close'] into one shared
+    buffer and attach all columns at once. Column names follow the
+    individual indicator modules ('SMA_{w}', 'RSI_{w}', 'BB_M|U|L_{w}').
+    """
+    close = as_writable(df["Close"].to_numpy(dtype=np.float64))
+    n = len(close)
+
+    names = []
+    if sma_window is not None:
+        names.append(f"SMA_{sma_window}")
+    if rsi_window is not None:
+        names.append(f"RSI_{rsi_window}")
+    if bb_window is not None:
+        names += [f"BB_M_{bb_window}", f"BB_U_{bb_window}", f"BB_L_{bb_window}"]
+
+    out = np.empty((n, len(names)))
+    col = 0
+    if sma_window is not None:
+        out[:, col] = _sma(close, sma_window)
+        col += 1
+    if rsi_window is not None and bb_window is not None:
+        # RSI and Bollinger requested together: single fused pass
+        rsi, mid, upper, lower = _rsi_bbands(
+            close, rsi_window, bb_window, float(bb_sigma)
+        )
+        out[:, col] = rsi
+        out[:, col + 1] = mid
+        out[:, col + 2] = upper
+        out[:, col + 3] = lower
+    else:
+        if rsi_window is not None:
+            out[:, col] = _rsi(close, rsi_window)
+            col += 1
+        if bb_window is not None:
+            mid, upper, lower = _bbands(close, bb_window, float(bb_sigma))
+            out[:, col] = mid
+            out[:, col + 1] = upper
+            out[:, col + 2] = lower
+
+    df[names] = out
+    return df
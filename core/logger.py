@@ -1,11 +1,22 @@
 """Logging setup using Loguru with Rich formatting."""
 
 from loguru import logger
-from rich.logging import RichHandler
 
 
 def init_logger(level: str = "INFO") -> None:
-    """Configure Loguru to use RichHandler."""
+    """Configure Loguru to use RichHandler.
+
+    Markup parsing and rich tracebacks are disabled by default: every
+    record otherwise runs through Rich's full render pipeline, which
+    adds up during backtest sweeps that log per step.
+    """
+    # Deferred so importing core.logger (which main.py does at the top)
+    # doesn't pull in rich before init_logger actually runs
+    from rich.logging import RichHandler
+
     logger.remove()
-    logger.add(RichHandler(markup=True, rich_tracebacks=True), level=level)
+    logger.add(
+        RichHandler(markup=False, rich_tracebacks=False, show_time=False),
+        level=level,
+    )
 
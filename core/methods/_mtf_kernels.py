@@ -0,0 +1,51 @@
+"""Numba kernels for the multi-timeframe filter.
+
+The hot per-bar passes live here as plain-array kernels so they compile
+with Numba (via the core._njit shim) and fall back to interpreted
+Python when Numba is unavailable.
+"""
+
+import numpy as np
+
+from core._njit import njit
+
+
+@njit(
+    "Tuple((i1[::1], f8[::1], i1[::1]))(f8[::1], i1[::1], f8)",
+    cache=True,
+    fastmath=True,
+)
+def entries_and_dd(close, signal, threshold):
+    """
+    Single stateful pass over the filtered signal: entry signals on
+    signal changes, the carried entry price, and double-down scale-in
+    codes (2 long, -2 short).
+
+    Returns:
+        (entry_signal int8, entry_price float64, double_down int8)
+    """
+    n = len(signal)
+    entry_signal = np.zeros(n, dtype=np.int8)
+    entry_price = np.full(n, np.nan)
+    double_down = np.zeros(n, dtype=np.int8)
+
+    prev = np.int8(0)
+    eprice = 0.0
+    in_trade = False
+    for i in range(n):
+        s = signal[i]
+        if s != 0 and s != prev:
+            # Initial entry bar: record the entry price, never scale in
+            entry_signal[i] = s
+            eprice = close[i]
+            in_trade = True
+        elif in_trade:
+            if s == 1 and close[i] < eprice * (1.0 - threshold):
+                double_down[i] = 2
+            elif s == -1 and close[i] > eprice * (1.0 + threshold):
+                double_down[i] = -2
+        if in_trade:
+            entry_price[i] = eprice
+        prev = s
+
+    return entry_signal, entry_price, double_down
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 from core.indicators.macd import macd
+from core.methods import reasons
 
 
 def analyze(
@@ -13,26 +14,26 @@ def analyze(
 
     Buy when MACD crosses above the signal line.
     Sell when MACD crosses below the signal line.
-    Adds columns 'MACD', 'MACD_signal', 'MACD_hist', 'signal', and 'reason'.
+    Adds columns 'MACD', 'MACD_signal', 'MACD_hist', 'signal', and 'reason_code'.
     """
     df = macd(df, fast=fast, slow=slow, signal=signal_window)
 
-    macd_col = "MACD"
-    sig_col = "MACD_signal"
-
-    prev_macd = df[macd_col].shift(1)
-    prev_sig = df[sig_col].shift(1)
-
-    cross_up = (df[macd_col] > df[sig_col]) & (prev_macd <= prev_sig)
-    cross_down = (df[macd_col] < df[sig_col]) & (prev_macd >= prev_sig)
-
-    df["signal"] = 0
-    df.loc[cross_up, "signal"] = 1
-    df.loc[cross_down, "signal"] = -1
-
-    df["reason"] = ""
-    df.loc[cross_up, "reason"] = "MACD crossed above signal"
-    df.loc[cross_down, "reason"] = "MACD crossed below signal"
+    # Crossovers from the sign of the MACD/signal spread: a cross-up is a
+    # positive sign preceded by a non-positive one (and vice versa).
+    # One pass over the arrays, no shift() intermediates.
+    diff = np.sign(df["MACD"].to_numpy() - df["MACD_signal"].to_numpy())
+
+    cross_up = np.zeros(len(diff), dtype=bool)
+    cross_down = np.zeros(len(diff), dtype=bool)
+    cross_up[1:] = (diff[1:] == 1) & (diff[:-1] <= 0)
+    cross_down[1:] = (diff[1:] == -1) & (diff[:-1] >= 0)
+
+    df["signal"] = np.where(cross_up, 1, np.where(cross_down, -1, 0)).astype(np.int8)
+    df["reason_code"] = np.where(
+        cross_up,
+        reasons.MACD_CROSS_UP,
+        np.where(cross_down, reasons.MACD_CROSS_DOWN, reasons.NONE),
+    ).astype(np.int8)
 
     return df
 
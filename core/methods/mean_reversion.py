@@ -1,6 +1,59 @@
+import numpy as np
 import pandas as pd
-from core.indicators.moving_averages import sma
-from core.indicators.rsi import rsi
+from core._njit import as_writable, njit
+from core.methods import reasons
+
+
+@njit(
+    "Tuple((f8[::1], f8[::1], i1[::1]))(f8[::1], i8, i8, f8, f8)",
+    cache=True,
+)
+def _mean_rev_kernel(close, sma_window, rsi_window, oversold, overbought):
+    """One pass over Close: running-sum SMA, Wilder RSI and the signal."""
+    n = len(close)
+    sma = np.empty(n)
+    rsi = np.full(n, np.nan)
+    signal = np.zeros(n, dtype=np.int8)
+
+    alpha = 2.0 / (rsi_window + 1.0)
+    s = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(n):
+        x = close[i]
+
+        # SMA via running sum (min_periods=1 semantics)
+        s += x
+        if i >= sma_window:
+            s -= close[i - sma_window]
+            sma[i] = s / sma_window
+        else:
+            sma[i] = s / (i + 1)
+
+        # Wilder-smoothed RSI, seeded from the first delta
+        if i >= 1:
+            delta = x - close[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            if i == 1:
+                avg_gain = gain
+                avg_loss = loss
+            else:
+                avg_gain = alpha * gain + (1.0 - alpha) * avg_gain
+                avg_loss = alpha * loss + (1.0 - alpha) * avg_loss
+            if avg_loss > 0.0:
+                rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            elif avg_gain > 0.0:
+                rsi[i] = 100.0
+
+        # Signal in the same sweep (NaN RSI compares false either way)
+        if x < sma[i] and rsi[i] < oversold:
+            signal[i] = 1
+        elif x > sma[i] and rsi[i] > overbought:
+            signal[i] = -1
+
+    return sma, rsi, signal
+
 
 def analyze(
     df: pd.DataFrame,
@@ -15,30 +68,25 @@ def analyze(
     - Signal =  1 for buy when price < SMA and RSI < oversold.
     - Signal = -1 for sell when price > SMA and RSI > overbought.
     - Otherwise signal = 0.
-    Adds columns: 'SMA_{sma_window}', 'RSI_{rsi_window}', 'signal', 'reason'.
+    Adds columns: 'SMA_{sma_window}', 'RSI_{rsi_window}', 'signal', 'reason_code'.
     """
-    # Calculate indicators
-    df = sma(df, window=sma_window)
-    df = rsi(df, window=rsi_window)
-
-    # Define column names
-    sma_col = f"SMA_{sma_window}"
-    rsi_col = f"RSI_{rsi_window}"
-
-    # Initialize signal and reason columns
-    df['signal'] = 0
-    df['reason'] = ''
-
-    # Define conditions
-    buy_cond = (df['Close'] < df[sma_col]) & (df[rsi_col] < oversold)
-    sell_cond = (df['Close'] > df[sma_col]) & (df[rsi_col] > overbought)
-
-    # Apply signals
-    df.loc[buy_cond, 'signal'] = 1
-    df.loc[sell_cond, 'signal'] = -1
+    # Indicators and signal in one fused kernel pass over Close
+    sma, rsi, signal = _mean_rev_kernel(
+        as_writable(df["Close"].to_numpy(dtype=np.float64)),
+        sma_window,
+        rsi_window,
+        float(oversold),
+        float(overbought),
+    )
 
-    # Add reasons
-    df.loc[buy_cond, 'reason'] = f"Price below {sma_col} and {rsi_col} below {oversold}"
-    df.loc[sell_cond, 'reason'] = f"Price above {sma_col} and {rsi_col} above {overbought}"
+    df[[f"SMA_{sma_window}", f"RSI_{rsi_window}"]] = np.column_stack((sma, rsi))
+    df.attrs["sma_col"] = f"SMA_{sma_window}"
+    df.attrs["rsi_col"] = f"RSI_{rsi_window}"
+    df["signal"] = signal
+    df["reason_code"] = np.where(
+        signal == 1,
+        reasons.MEAN_REV_BUY,
+        np.where(signal == -1, reasons.MEAN_REV_SELL, reasons.NONE),
+    ).astype(np.int8)
 
     return df
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 from core.indicators.moving_averages import sma
+from core.methods import reasons
 
 
 def analyze(
@@ -12,7 +13,7 @@ def analyze(
 
     Buy when short SMA crosses above long SMA.
     Sell when short SMA crosses below long SMA.
-    Adds columns 'SMA_{short_window}', 'SMA_{long_window}', 'signal', and 'reason'.
+    Adds columns 'SMA_{short_window}', 'SMA_{long_window}', 'signal', and 'reason_code'.
     """
     df = sma(df, window=short_window)
     df = sma(df, window=long_window)
@@ -20,19 +21,21 @@ def analyze(
     short_col = f"SMA_{short_window}"
     long_col = f"SMA_{long_window}"
 
-    prev_short = df[short_col].shift(1)
-    prev_long = df[long_col].shift(1)
-
-    cross_up = (df[short_col] > df[long_col]) & (prev_short <= prev_long)
-    cross_down = (df[short_col] < df[long_col]) & (prev_short >= prev_long)
-
-    df["signal"] = 0
-    df.loc[cross_up, "signal"] = 1
-    df.loc[cross_down, "signal"] = -1
-
-    df["reason"] = ""
-    df.loc[cross_up, "reason"] = f"{short_col} crossed above {long_col}"
-    df.loc[cross_down, "reason"] = f"{short_col} crossed below {long_col}"
+    # Crossovers from the sign of the short/long SMA spread: a cross-up is
+    # a positive sign preceded by a non-positive one (and vice versa).
+    diff = np.sign(df[short_col].to_numpy() - df[long_col].to_numpy())
+
+    cross_up = np.zeros(len(diff), dtype=bool)
+    cross_down = np.zeros(len(diff), dtype=bool)
+    cross_up[1:] = (diff[1:] == 1) & (diff[:-1] <= 0)
+    cross_down[1:] = (diff[1:] == -1) & (diff[:-1] >= 0)
+
+    df["signal"] = np.where(cross_up, 1, np.where(cross_down, -1, 0)).astype(np.int8)
+    df["reason_code"] = np.where(
+        cross_up,
+        reasons.SMA_CROSS_UP,
+        np.where(cross_down, reasons.SMA_CROSS_DOWN, reasons.NONE),
+    ).astype(np.int8)
 
     return df
 
@@ -17,8 +17,11 @@ from core.methods.mean_reversion import analyze as trigger_analyze
 
 # Indicator helpers
 from core.indicators.moving_averages import sma
-from core.indicators.rsi import rsi
-from core.indicators.bbands import bollinger
+from core.indicators.stack import compute_indicators
+
+# JIT kernels for the hot filter passes
+from core.methods._mtf_kernels import entries_and_dd
+from core._njit import as_writable
 
 
 # ---------------------------------------------------------------------------
@@ -41,7 +44,10 @@ def trend_analyze(df: pd.DataFrame, sma_window: int = 100) -> pd.DataFrame:
     """
     df = sma(df, window=sma_window)
     sma_col = f"SMA_{sma_window}"
-    df["trend"] = (df["Close"] > df[sma_col]).astype(int).replace({0: -1})
+    df.attrs["sma_col"] = sma_col  # consumers read this instead of scanning columns
+    df["trend"] = np.where(
+        df["Close"].to_numpy() > df[sma_col].to_numpy(), np.int8(1), np.int8(-1)
+    )
     return df
 
 
@@ -62,28 +68,30 @@ def zone_analyze(
     Adds:
         • RSI_{window}
         • BB_M|U|L_{bb_window}
-        • zone : {'oversold', 'overbought', 'neutral'}
+        • zone : int8 code (-1 oversold, +1 overbought, 0 neutral)
 
     Oversold  = Close < lower Bollinger band AND RSI below rsi_oversold.
     Overbought = Close > upper Bollinger band AND RSI above rsi_overbought.
     """
-    # --- RSI ---
-    df = rsi(df, window=rsi_window)
+    # --- RSI + Bollinger Bands, attached in one batch ---
+    df = compute_indicators(
+        df, rsi_window=rsi_window, bb_window=bb_window, bb_sigma=bb_sigma
+    )
     rsi_col = f"RSI_{rsi_window}"
-
-    # --- Bollinger Bands ---
-    df = bollinger(df, window=bb_window, n_sigma=bb_sigma)
     lower_band = f"BB_L_{bb_window}"
     upper_band = f"BB_U_{bb_window}"
+    # Seed the lookup caches so the plotting helpers never scan df.columns
+    df.attrs["rsi_col"] = rsi_col
+    df.attrs["_bb_cols"] = (upper_band, lower_band)
 
     # Define oversold / overbought using BOTH RSI and Bollinger extremes
     oversold_cond = (df["Close"] < df[lower_band]) & (df[rsi_col] < rsi_oversold)
     overbought_cond = (df["Close"] > df[upper_band]) & (df[rsi_col] > rsi_overbought)
 
-    df["zone"] = np.select(
-        [oversold_cond, overbought_cond],
-        ["oversold", "overbought"],
-        default="neutral",
+    # int8 codes instead of strings: 1 byte/row and the downstream
+    # comparisons/ffill stay on fast integer paths
+    df["zone"] = np.where(oversold_cond, -1, np.where(overbought_cond, 1, 0)).astype(
+        np.int8
     )
     return df
 
@@ -117,56 +125,62 @@ def multi_tf_filter(
         • timestamp falls within an hourly oversold/overbought zone matching the signal
 
     Signal mapping:
-        +1 (long)  valid in daily up‑trend and hourly 'oversold'
-        -1 (short) valid in daily down‑trend and hourly 'overbought'
+        +1 (long)  valid in daily up‑trend and hourly oversold  (zone == -1)
+        -1 (short) valid in daily down‑trend and hourly overbought (zone == +1)
 
     Returns:
         Filtered 15‑minute dataframe with invalid signals set to 0.
     """
-    # Forward‑fill daily & hourly context to 15‑minute index
-    daily_trend = daily_df["trend"].reindex(m15_df.index, method="ffill")
-    hourly_zone = hourly_df["zone"].reindex(m15_df.index, method="ffill")
-
-    # Validity masks
-    long_ok = (daily_trend == 1) & (hourly_zone == "oversold")
-    short_ok = (daily_trend == -1) & (hourly_zone == "overbought")
-
-    valid_mask = ((m15_df["signal"] == 1) & long_ok) | (
-        (m15_df["signal"] == -1) & short_ok
-    )
-
-    m15_df.loc[~valid_mask, "signal"] = 0
-    m15_df.loc[~valid_mask, "reason"] = ""  # clear reasons for filtered signals
-    # Entry signal: only on signal changes
-    m15_df["entry_signal"] = (
-        (m15_df["signal"] != m15_df["signal"].shift(1))
-        & (m15_df["signal"] != 0)
-    ).astype(int) * m15_df["signal"]
-
-    # Double-down signal: scaling into positions on extended drawdowns
-    # Compute the entry price for each open position
-    m15_df["entry_price"] = m15_df["Close"].where(m15_df["entry_signal"] != 0).ffill()
-
-    # Define a threshold for scaling in (e.g., 1% adverse move)
+    # Forward‑fill daily & hourly context to the 15‑minute index via
+    # searchsorted on the sorted parent timestamps — a binary-search
+    # gather instead of reindex's hash/indexer path. searchsorted is
+    # silently wrong on unsorted input, so guard the parent frames
+    # (always sorted post-resample; the check is O(1) when cached).
+    if not daily_df.index.is_monotonic_increasing:
+        daily_df = daily_df.sort_index()
+    if not hourly_df.index.is_monotonic_increasing:
+        hourly_df = hourly_df.sort_index()
+
+    m15_ts = m15_df.index.to_numpy()
+    daily_pos = np.searchsorted(daily_df.index.to_numpy(), m15_ts, side="right") - 1
+    hourly_pos = np.searchsorted(hourly_df.index.to_numpy(), m15_ts, side="right") - 1
+
+    daily_trend = daily_df["trend"].to_numpy()[np.maximum(daily_pos, 0)]
+    hourly_zone = hourly_df["zone"].to_numpy()[np.maximum(hourly_pos, 0)]
+
+    # Validity masks (bars before the first parent bar have no context)
+    long_ok = (daily_trend == 1) & (hourly_zone == -1)
+    short_ok = (daily_trend == -1) & (hourly_zone == 1)
+    has_context = (daily_pos >= 0) & (hourly_pos >= 0)
+
+    raw_signal = m15_df["signal"].to_numpy()
+    valid_mask = (
+        ((raw_signal == 1) & long_ok) | ((raw_signal == -1) & short_ok)
+    ) & has_context
+
+    # Zero out filtered rows on plain ndarrays and write each column back
+    # once — a masked .loc set per column would route every write through
+    # the pandas indexer machinery
+    kill = ~valid_mask
+    sig = m15_df["signal"].to_numpy(dtype=np.int8, copy=True)
+    sig[kill] = 0
+    codes = m15_df["reason_code"].to_numpy(copy=True)
+    codes[kill] = 0  # clear reasons for filtered signals
+
+    close = as_writable(m15_df["Close"].to_numpy(dtype=np.float64))
+
+    # Threshold for scaling in (e.g., 1% adverse move)
     threshold = 0.01
 
-    # Identify double-down conditions:
-    # For longs: post-entry price drops below entry_price by threshold
-    dd_long = (
-        (m15_df["signal"] == 1)  # still in a long trade
-        & (m15_df["Close"] < m15_df["entry_price"] * (1 - threshold))
-        & (m15_df["entry_signal"] == 0)  # not the initial entry bar
-    )
-    # For shorts: post-entry price rises above entry_price by threshold
-    dd_short = (
-        (m15_df["signal"] == -1)
-        & (m15_df["Close"] > m15_df["entry_price"] * (1 + threshold))
-        & (m15_df["entry_signal"] == 0)
-    )
-
-    # Create a double_down column:  2 for long scale-in, -2 for short scale-in, 0 otherwise
-    m15_df["double_down"] = 0
-    m15_df.loc[dd_long, "double_down"] = 2
-    m15_df.loc[dd_short, "double_down"] = -2
-
-    return m15_df
\ No newline at end of file
+    # double_down:  2 for long scale-in, -2 for short scale-in, 0 otherwise
+    entry_signal, entry_price, double_down = entries_and_dd(close, sig, threshold)
+
+    # All arrays are ready — attach them in one assign() so the frame is
+    # rebuilt once instead of consolidating after every column insert
+    return m15_df.assign(
+        signal=sig,
+        reason_code=codes,
+        entry_signal=entry_signal,
+        entry_price=entry_price,
+        double_down=double_down,
+    )
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""Signal reason codes.
+
+Strategies tag each signal with an int8 ``reason_code`` instead of a
+per-row Python string: 1 byte/row instead of an object column, and the
+codes pass straight through NumPy/Numba paths. ``decode_reasons`` maps
+codes back to text for the rare human-facing uses (chart annotations).
+"""
+
+import pandas as pd
+
+NONE = 0
+MEAN_REV_BUY = 1
+MEAN_REV_SELL = 2
+MACD_CROSS_UP = 3
+MACD_CROSS_DOWN = 4
+SMA_CROSS_UP = 5
+SMA_CROSS_DOWN = 6
+
+REASONS = {
+    NONE: "",
+    MEAN_REV_BUY: "Price below SMA and RSI oversold",
+    MEAN_REV_SELL: "Price above SMA and RSI overbought",
+    MACD_CROSS_UP: "MACD crossed above signal",
+    MACD_CROSS_DOWN: "MACD crossed below signal",
+    SMA_CROSS_UP: "Short SMA crossed above long SMA",
+    SMA_CROSS_DOWN: "Short SMA crossed below long SMA",
+}
+
+
+def decode_reasons(df: pd.DataFrame) -> pd.Series:
+    """Return the human-readable reason text for each row's reason_code.
+
+    Backed by a Categorical built straight from the codes, so the result
+    stays 1 byte/row plus the small label dictionary rather than an
+    object column of repeated strings.
+    """
+    labels = [REASONS[k] for k in sorted(REASONS)]
+    cat = pd.Categorical.from_codes(df["reason_code"].to_numpy(), categories=labels)
+    return pd.Series(cat, index=df.index, name="reason")
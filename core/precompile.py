@@ -0,0 +1,27 @@
+"""Warm the Numba compilation cache.
+
+The indicator kernels carry explicit signatures, so importing their
+modules compiles them (or reloads the machine code that cache=True
+stored under __pycache__). Run once after install or in CI:
+
+    python -m core.precompile
+"""
+
+from loguru import logger
+
+
+def precompile() -> None:
+    """Import every module that defines an @njit kernel."""
+    import core.indicators.bbands  # noqa: F401
+    import core.indicators.macd  # noqa: F401
+    import core.indicators.moving_averages  # noqa: F401
+    import core.indicators.rsi  # noqa: F401
+    import core.indicators.stack  # noqa: F401
+    import core.methods._mtf_kernels  # noqa: F401
+    import core.methods.mean_reversion  # noqa: F401
+
+    logger.info("Numba kernels compiled and cached")
+
+
+if __name__ == "__main__":
+    precompile()
@@ -1,48 +1,68 @@
 # core/visualizer.py
-import matplotlib.pyplot as plt
+import numpy as np
+
+from core.methods.reasons import REASONS
+
+
+def _find_bb_cols(df):
+    """
+    Locate the upper/lower Bollinger Band columns, caching the result in
+    df.attrs so repeated panels skip the column scan.
+
+    Returns (upper_col, lower_col) or None if the bands are absent.
+    """
+    if "_bb_cols" in df.attrs:
+        return df.attrs["_bb_cols"]
+    bb_upper_cols = [c for c in df.columns if c.startswith("BB_U_")]
+    bb_lower_cols = [c for c in df.columns if c.startswith("BB_L_")]
+    cols = (bb_upper_cols[0], bb_lower_cols[0]) if bb_upper_cols and bb_lower_cols else None
+    df.attrs["_bb_cols"] = cols
+    return cols
+
 
 def plot_signals(df, symbol: str = "", timeframe: str = ""):
     """
     Plot Close price and SMA, and mark buy/sell signals.
     """
-    # Identify SMA column
-    sma_cols = [col for col in df.columns if col.startswith("SMA_")]
-    sma_col = sma_cols[0] if sma_cols else None
+    # Deferred so importing this module doesn't pay matplotlib's startup cost
+    import matplotlib.pyplot as plt
+
+    # Identify SMA column: the analyze step records it in df.attrs; fall
+    # back to a column scan for frames built elsewhere
+    sma_col = df.attrs.get("sma_col")
+    if sma_col is None:
+        sma_cols = [col for col in df.columns if col.startswith("SMA_")]
+        sma_col = sma_cols[0] if sma_cols else None
 
     plt.figure(figsize=(12, 6))
     plt.plot(df.index, df["Close"], label="Close")
     if sma_col:
         plt.plot(df.index, df[sma_col], label=sma_col)
 
-    # Plot buy and sell signals
-    buys = df[df["signal"] == 1]
-    sells = df[df["signal"] == -1]
-    plt.scatter(buys.index, buys["Close"], marker="^", label="Buy", alpha=1)
-    plt.scatter(sells.index, sells["Close"], marker="v", label="Sell", alpha=1)
-
-    # Annotate buy signals with reasons
-    for idx, row in buys.iterrows():
-        reason = row.get("reason", "")
-        if reason:
-            plt.annotate(
-                reason,
-                (idx, row["Close"]),
-                textcoords="offset points",
-                xytext=(0, 10),
-                ha="center",
-                fontsize=8,
-                rotation=0
-            )
+    # Plot buy and sell signals from raw arrays
+    idx = df.index.to_numpy()
+    close = df["Close"].to_numpy()
+    sig = df["signal"].to_numpy()
+    codes = (
+        df["reason_code"].to_numpy()
+        if "reason_code" in df.columns
+        else np.zeros(len(df), dtype=np.int8)
+    )
+    buys = sig == 1
+    sells = sig == -1
+    plt.scatter(idx[buys], close[buys], marker="^", label="Buy", alpha=1)
+    plt.scatter(idx[sells], close[sells], marker="v", label="Sell", alpha=1)
 
-    # Annotate sell signals with reasons
-    for idx, row in sells.iterrows():
-        reason = row.get("reason", "")
-        if reason:
+    # Annotate signals with reasons — only the rows that carry one,
+    # zipped from ndarrays instead of boxing each row via iterrows()
+    for mask, y_off in ((buys, 10), (sells, -15)):
+        mask = mask & (codes != 0)
+        for x, y, code in zip(idx[mask], close[mask], codes[mask]):
             plt.annotate(
-                reason,
-                (idx, row["Close"]),
+                REASONS.get(code, ""),
+                (x, y),
                 textcoords="offset points",
-                xytext=(0, -15),
+                xytext=(0, y_off),
                 ha="center",
                 fontsize=8,
                 rotation=0
@@ -80,6 +100,8 @@ def plot_multi_tf(
         m15_df   : DataFrame containing columns ['Close', 'signal'].
         symbol   : Ticker symbol for chart title.
     """
+    import matplotlib.pyplot as plt
+
     # Determine number of rows: add equity row if provided
     has_equity = equity is not None
     n_rows = 4 if has_equity else 3
@@ -126,27 +148,30 @@ def plot_multi_tf(
     ax1 = axes[1]
     ax1.plot(hourly_df.index, hourly_df["Close"], label="Close")
     # Plot Bollinger Bands if present
-    bb_upper_cols = [c for c in hourly_df.columns if c.startswith("BB_U_")]
-    bb_lower_cols = [c for c in hourly_df.columns if c.startswith("BB_L_")]
-    if bb_upper_cols and bb_lower_cols:
-        up_col = bb_upper_cols[0]
-        lo_col = bb_lower_cols[0]
+    bb_cols = _find_bb_cols(hourly_df)
+    if bb_cols:
+        up_col, lo_col = bb_cols
         ax1.plot(hourly_df.index, hourly_df[up_col], color="grey", linewidth=0.8, alpha=0.7, label="Upper BB")
         ax1.plot(hourly_df.index, hourly_df[lo_col], color="grey", linewidth=0.8, alpha=0.7, label="Lower BB")
 
-    oversold = hourly_df["zone"] == "oversold"
-    overbought = hourly_df["zone"] == "overbought"
+    # Gather marker points from raw arrays — boolean-slicing the whole
+    # DataFrame would copy every column just to read index and Close
+    hr_idx = hourly_df.index.to_numpy()
+    hr_close = hourly_df["Close"].to_numpy()
+    hr_zone = hourly_df["zone"].to_numpy()
+    oversold = hr_zone == -1
+    overbought = hr_zone == 1
 
     ax1.scatter(
-        hourly_df[oversold].index,
-        hourly_df[oversold]["Close"],
+        hr_idx[oversold],
+        hr_close[oversold],
         marker="^",
         color="green",
         label="Hourly oversold",
     )
     ax1.scatter(
-        hourly_df[overbought].index,
-        hourly_df[overbought]["Close"],
+        hr_idx[overbought],
+        hr_close[overbought],
         marker="v",
         color="red",
         label="Hourly overbought",
@@ -159,45 +184,50 @@ def plot_multi_tf(
     ax2 = axes[2]
     ax2.plot(m15_df.index, m15_df["Close"], label="Close")
     # Plot Bollinger Bands if present
-    bb_upper_cols = [c for c in m15_df.columns if c.startswith("BB_U_")]
-    bb_lower_cols = [c for c in m15_df.columns if c.startswith("BB_L_")]
-    if bb_upper_cols and bb_lower_cols:
-        up_col = bb_upper_cols[0]
-        lo_col = bb_lower_cols[0]
+    bb_cols = _find_bb_cols(m15_df)
+    if bb_cols:
+        up_col, lo_col = bb_cols
         ax2.plot(m15_df.index, m15_df[up_col], color="grey", linewidth=0.8, alpha=0.7, label="Upper BB")
         ax2.plot(m15_df.index, m15_df[lo_col], color="grey", linewidth=0.8, alpha=0.7, label="Lower BB")
 
-    entry = m15_df.get("entry_signal", m15_df["signal"])
+    m15_idx = m15_df.index.to_numpy()
+    m15_close = m15_df["Close"].to_numpy()
+    entry = m15_df.get("entry_signal", m15_df["signal"]).to_numpy()
+    dd = (
+        m15_df["double_down"].to_numpy()
+        if "double_down" in m15_df.columns
+        else np.zeros(len(m15_df), dtype=np.int8)
+    )
     longs = entry == 1
     shorts = entry == -1
-    double_longs = m15_df.get("double_down", 0) == 2
-    double_shorts = m15_df.get("double_down", 0) == -2
+    double_longs = dd == 2
+    double_shorts = dd == -2
 
     ax2.scatter(
-        m15_df[longs].index,
-        m15_df[longs]["Close"],
+        m15_idx[longs],
+        m15_close[longs],
         marker="^",
         color="green",
         label="Long entry",
     )
     ax2.scatter(
-        m15_df[shorts].index,
-        m15_df[shorts]["Close"],
+        m15_idx[shorts],
+        m15_close[shorts],
         marker="v",
         color="red",
         label="Short entry",
     )
     # Scale-in markers
     ax2.scatter(
-        m15_df[double_longs].index,
-        m15_df[double_longs]["Close"],
+        m15_idx[double_longs],
+        m15_close[double_longs],
         marker="o",
         color="blue",
         label="Scale-in long",
     )
     ax2.scatter(
-        m15_df[double_shorts].index,
-        m15_df[double_shorts]["Close"],
+        m15_idx[double_shorts],
+        m15_close[double_shorts],
         marker="o",
         color="orange",
         label="Scale-in short",
@@ -210,25 +240,25 @@ def plot_multi_tf(
     if has_equity:
         ax3 = axes[3]
         ax3.plot(equity.index, equity, label="Equity")
-        # Mark buy and sell on equity curve
-        buys_eq = equity[m15_df["signal"] == 1]
-        sells_eq = equity[m15_df["signal"] == -1]
-        ax3.scatter(buys_eq.index, buys_eq.values, marker="^", color="green", label="Buy", zorder=3)
-        ax3.scatter(sells_eq.index, sells_eq.values, marker="v", color="red", label="Sell", zorder=3)
-        # Scale-in markers on equity
-        double_longs_eq = equity[m15_df["double_down"] == 2]
-        double_shorts_eq = equity[m15_df["double_down"] == -2]
+        # Mark buy, sell and scale-in bars on the equity curve
+        eq_idx = equity.index.to_numpy()
+        eq_vals = equity.to_numpy()
+        sig = m15_df["signal"].to_numpy()
+        buys = sig == 1
+        sells = sig == -1
+        ax3.scatter(eq_idx[buys], eq_vals[buys], marker="^", color="green", label="Buy", zorder=3)
+        ax3.scatter(eq_idx[sells], eq_vals[sells], marker="v", color="red", label="Sell", zorder=3)
         ax3.scatter(
-            double_longs_eq.index,
-            double_longs_eq.values,
+            eq_idx[double_longs],
+            eq_vals[double_longs],
             marker="o",
             color="blue",
             label="Scale-in Buy",
             zorder=3
         )
         ax3.scatter(
-            double_shorts_eq.index,
-            double_shorts_eq.values,
+            eq_idx[double_shorts],
+            eq_vals[double_shorts],
             marker="o",
             color="orange",
             label="Scale-in Sell",
@@ -1,8 +1,11 @@
 # main.py
 import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import yaml
-from rich.console import Console
-from core.dataloader import load_data, resample_df
+from joblib import Memory
+from core.dataloader import load_data, load_parquet, resample_df
 from core.methods.mean_reversion import analyze
 from core.methods.multi_mean_reversion import (
     trend_analyze,
@@ -10,12 +13,63 @@ from core.methods.multi_mean_reversion import (
     trigger,
     multi_tf_filter,
 )
-from core.visualizer import plot_signals, plot_multi_tf
 from core.logger import init_logger
 from loguru import logger
 from core.backtest import backtest_signals
 
-console = Console()
+# Disk cache for the heavy prepare step — during parameter sweeps most
+# runs repeat the same resample/trend/zone/trigger work
+memory = Memory(".cache_ta", verbose=0)
+
+
+def load_raw(file):
+    """
+    Load the raw bar data, preferring a Parquet sidecar over re-parsing
+    the CSV. The sidecar is written on first load and reused while it is
+    newer than the CSV — columnar I/O instead of text parsing on every
+    subsequent run.
+    """
+    sidecar = file + ".parquet"
+    if os.path.exists(sidecar) and os.path.getmtime(sidecar) >= os.path.getmtime(file):
+        return load_parquet(sidecar)
+
+    raw_df = load_data(file)
+    try:
+        raw_df.to_parquet(sidecar, engine="pyarrow", compression="zstd")
+    except OSError as exc:
+        logger.debug("Could not write parquet sidecar {}: {}", sidecar, exc)
+    return raw_df
+
+
+@memory.cache
+def prepare_multi_tf(file, file_mtime, start_date, end_date, mtf):
+    """
+    Load, slice and build the three analyzed timeframe frames.
+
+    file_mtime is only part of the signature so the cache invalidates
+    when the data file changes.
+    """
+    raw_df = load_raw(file).loc[start_date:end_date]
+
+    # Cascade the resamples: 1H buckets are unions of 15T buckets and 1D
+    # of 1H, so each coarser frame aggregates the previous (small) one
+    # instead of re-traversing the raw minute bars
+    m15_df    = resample_df(raw_df, "15T")
+    hourly_df = resample_df(m15_df, "1H")
+    daily_df  = resample_df(hourly_df, "1D")
+
+    daily_df  = trend_analyze(daily_df, sma_window=mtf["trend_sma_window"])
+    hourly_df = zone_analyze(
+        hourly_df,
+        rsi_window=mtf["zone_rsi_window"],
+        rsi_oversold=mtf["zone_oversold"],
+        rsi_overbought=mtf["zone_overbought"],
+        bb_window=mtf["bb_window"],
+        bb_sigma=mtf["bb_sigma"],
+    )
+    m15_df    = trigger(m15_df)
+    return daily_df, hourly_df, m15_df
+
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Technical Analysis Learning CLI")
@@ -27,9 +81,16 @@ def parse_args():
     return parser.parse_args()
 
 def main():
+    args = parse_args()
+
+    # Deferred imports: rich and matplotlib (via the visualizer) add a few
+    # hundred ms of startup that --help shouldn't pay
+    from rich.console import Console
+    from core.visualizer import plot_signals, plot_multi_tf
+
     init_logger()
+    console = Console()
     console.print("[bold green]Starting analysis...[/bold green]")
-    args = parse_args()
     # Load configuration
     with open(args.config, "r") as f:
         cfg = yaml.safe_load(f)
@@ -38,45 +99,48 @@ def main():
     stf = cfg["single_tf"]
     mtf = cfg["multi_tf"]
 
-    # Load and optionally filter data
     logger.info("Loading data range {start} to {end}", start=gen["start_date"], end=gen["end_date"])
-    raw_df = load_data(gen["file"])
-    raw_df = raw_df.loc[gen["start_date"] : gen["end_date"]]
 
     if gen.get("multi_tf"):
         logger.info("Running multi-timeframe analysis")
-        # Multi-timeframe pipeline
-        daily_df  = resample_df(raw_df, "1D")
-        hourly_df = resample_df(raw_df, "1H")
-        m15_df    = resample_df(raw_df, "15T")
-
-        daily_df  = trend_analyze(daily_df, sma_window=mtf["trend_sma_window"])
-        hourly_df = zone_analyze(
-            hourly_df,
-            rsi_window=mtf["zone_rsi_window"],
-            rsi_oversold=mtf["zone_oversold"],
-            rsi_overbought=mtf["zone_overbought"],
-            bb_window=mtf["bb_window"],
-            bb_sigma=mtf["bb_sigma"],
+        # Multi-timeframe pipeline (prepare step cached on disk, keyed by
+        # data-file mtime, date range and strategy parameters)
+        daily_df, hourly_df, m15_df = prepare_multi_tf(
+            gen["file"],
+            os.path.getmtime(gen["file"]),
+            gen["start_date"],
+            gen["end_date"],
+            mtf,
         )
-        m15_df    = trigger(m15_df)
         m15_df    = multi_tf_filter(m15_df, hourly_df, daily_df)
         equity = backtest_signals(m15_df)
         plot_multi_tf(daily_df, hourly_df, m15_df, equity=equity, symbol=gen["symbol"])
 
     else:
         logger.info("Running single-timeframe analysis")
-        # Single-timeframe loop
-        for tf in stf["timeframes"]:
-            logger.debug(f"Processing timeframe {tf}")
+        raw_df = load_raw(gen["file"]).loc[gen["start_date"] : gen["end_date"]]
+
+        # Each timeframe is independent, and the heavy lifting happens in
+        # numpy/numba code that releases the GIL — analyze in parallel,
+        # then plot sequentially (matplotlib is not thread-safe).
+        def analyze_tf(tf):
+            logger.debug("Processing timeframe {}", tf)
             df_tf = resample_df(raw_df, tf)
-            result = analyze(
+            return tf, analyze(
                 df_tf,
                 sma_window=stf["sma_window"],
                 rsi_window=stf["rsi_window"],
                 oversold=stf["oversold"],
                 overbought=stf["overbought"],
             )
+
+        timeframes = stf["timeframes"]
+        with ThreadPoolExecutor(
+            max_workers=min(len(timeframes), os.cpu_count() or 1)
+        ) as executor:
+            results = list(executor.map(analyze_tf, timeframes))
+
+        for tf, result in results:
             plot_signals(result, symbol=gen["symbol"], timeframe=tf)
 
     logger.success("Analysis complete")